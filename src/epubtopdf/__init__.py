@@ -9,12 +9,18 @@ __author__ = "EPUB to PDF Converter Team"
 __email__ = "contact@epubtopdf.example"
 __description__ = "A Python GUI application for converting EPUB files to PDF format"
 
-# Import main modules for easier access
-from .converter import EpubToPdfConverter
-from .gui import EpubToPdfGUI
-
 __all__ = [
     "EpubToPdfConverter",
     "EpubToPdfGUI",
     "__version__",
 ]
+
+def __getattr__(name):
+    """Import main modules lazily, so CLI start-up does not pay for them."""
+    if name == "EpubToPdfConverter":
+        from .converter import EpubToPdfConverter
+        return EpubToPdfConverter
+    if name == "EpubToPdfGUI":
+        from .gui import EpubToPdfGUI
+        return EpubToPdfGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
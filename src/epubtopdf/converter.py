@@ -2,25 +2,304 @@
 This module provides functionality to convert EPUB files to PDF format
 using various PDF generation libraries.
 """
+import io
 import os
+import re
+import queue
+import threading
+import itertools
+import collections
 import tempfile
+import zipfile
 import logging
+import functools
+from array import array
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Callable
-from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, Iterable, List, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import ebooklib
 from ebooklib import epub
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+from reportlab.platypus import (
+    BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, PageBreak
+)
+from reportlab.platypus.doctemplate import PageBegin, NextPageTemplate
+from reportlab.platypus.flowables import PageBreakIfNotEmpty
 from reportlab.lib.enums import TA_JUSTIFY, TA_LEFT, TA_CENTER
 from reportlab.lib.units import inch
+from lxml import etree, html
 from bs4 import BeautifulSoup
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Block-level elements extracted from each document, in document order
+_BLOCK_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p')
+
+# Kinds of extracted content items
+T_TITLE, T_AUTHOR, T_HEADING, T_PARA, T_PAGEBREAK = range(5)
+
+# Content blocks (one per document) buffered between the parsing thread
+# and PDF layout
+_CONTENT_QUEUE_SIZE = 8
+
+# Flowables buffered for the layout engine, and the minimum kept queued so
+# keepWithNext groups are never split at a batch boundary
+_FLOWABLE_BATCH_SIZE = 500
+_FLOWABLE_LOOKAHEAD = 50
+
+# Sentinel marking the end of the content stream
+_END_OF_CONTENT = object()
+
+# Total document size below which parsing stays serial even when worker
+# processes are allowed. lxml parses roughly 15 MB/s, while starting a
+# spawn-based pool (Windows, macOS) costs 0.3-1 s of re-imports, so the
+# pool only pays off for very large books.
+_PARALLEL_PARSE_MIN_BYTES = 32 << 20
+
+# Per-thread storage for reusable lxml parsers
+_parser_local = threading.local()
+
+# Read buffer used when opening EPUB archives
+_EPUB_READ_BUFFER = 1 << 20
+
+# Paragraph text cleanup, each applied in a single pass. Line breaks are
+# whitespace too, so _WS_RE also folds them; NBSP is listed explicitly.
+_WS_RE = re.compile(r'[\s\u00a0]+')
+_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+@dataclass
+class Content:
+    """Block of extracted content items stored as parallel arrays.
+    
+    Item kinds are the T_* constants; levels are only meaningful for
+    headings and are 0 otherwise. Tolerant mode warnings raised while
+    parsing are collected in ``warnings`` so they can be logged by the
+    parent process.
+    """
+    types: array = field(default_factory=lambda: array('b'))
+    texts: list = field(default_factory=list)
+    levels: array = field(default_factory=lambda: array('b'))
+    warnings: list = field(default_factory=list)
+    
+    def append(self, kind: int, text: str = '', level: int = 0) -> None:
+        """Append one content item."""
+        self.types.append(kind)
+        self.texts.append(text)
+        self.levels.append(level)
+        
+    def __iter__(self):
+        return zip(self.types, self.texts, self.levels)
+        
+    def __len__(self) -> int:
+        return len(self.types)
+
+def _element_text(element) -> str:
+    """Return the text of an lxml or BeautifulSoup element."""
+    if etree.iselement(element):
+        return element.text_content()
+    return element.get_text()
+
+def _clean_text(text: str) -> str:
+    """Collapse all whitespace runs, line breaks included, into single spaces."""
+    return _WS_RE.sub(' ', text).strip()
+
+def _is_blank(element) -> bool:
+    """Cheaply detect elements without text, before full text extraction."""
+    if etree.iselement(element):
+        return len(element) == 0 and not (element.text or '').strip()
+    return not element.get_text(strip=True)
+
+def _get_html_parser() -> html.HTMLParser:
+    """Return a reusable lxml HTML parser for the current thread.
+    
+    lxml parsers are not safe to share between threads, so each worker
+    thread (or process) builds its own once and reuses it for every
+    document. Comments and processing instructions are dropped at parse time.
+    """
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = html.HTMLParser(recover=True, remove_comments=True, remove_pis=True)
+        _parser_local.parser = parser
+    return parser
+
+def _iter_blocks(data: bytes, tolerant_mode: bool, warnings: list):
+    """Yield (tag, element) pairs for headings and paragraphs in document order.
+    
+    Documents are parsed with lxml; BeautifulSoup is only used as a
+    fallback in tolerant mode when lxml rejects the markup, and a warning
+    is appended to ``warnings`` when it is. Empty or whitespace-only
+    documents (ebooklib returns b"" for chapters it could not load) yield
+    nothing, since lxml rejects them as "Document is empty".
+    """
+    if not data or data.isspace():
+        return
+        
+    try:
+        tree = html.fromstring(data, parser=_get_html_parser())
+    except (etree.ParserError, ValueError) as e:
+        if not tolerant_mode:
+            raise
+        warnings.append(f"lxml could not parse document, falling back to BeautifulSoup: {e}")
+        # bs4 picks up cchardet (the 'speedups' extra) by itself if installed
+        for element in BeautifulSoup(data, 'lxml').find_all(_BLOCK_TAGS):
+            yield element.name, element
+        return
+        
+    for element in tree.iter(*_BLOCK_TAGS):
+        yield element.tag, element
+
+def _extract_paragraph_text(element) -> str:
+    """Extract text from paragraph element in a single pass.
+    
+    Only the element's text nodes are gathered, so malformed children such
+    as broken img tags are never rendered and cannot make extraction fail.
+    """
+    if etree.iselement(element):
+        parts = element.itertext()
+    else:
+        parts = element.strings
+    return ''.join(parts).strip()
+
+def _parse_one_doc(payload) -> Content:
+    """Parse a single EPUB document into content items.
+    
+    Kept at module level so it can be pickled and run in worker processes.
+    Warnings are returned in the result rather than logged, since log
+    records emitted in a worker process never reach the parent's handlers.
+    
+    Args:
+        payload: Tuple of (document bytes, tolerant_mode)
+        
+    Returns:
+        Content: Content items for the document, ending with a page break
+    """
+    data, tolerant_mode = payload
+    content = Content()
+    try:
+        # Walk headings and paragraphs once, in document order
+        for tag, element in _iter_blocks(data, tolerant_mode, content.warnings):
+            if tag == 'p':
+                # Skip empty paragraphs (e.g. <p>&nbsp;</p>) before doing any work
+                if _is_blank(element):
+                    continue
+                # Handle paragraphs that may contain problematic img tags or other elements
+                text = _extract_paragraph_text(element)
+                if text:
+                    content.append(T_PARA, _clean_text(text))
+            else:
+                try:
+                    text = _element_text(element).strip()
+                    if text:
+                        content.append(T_HEADING, text, int(tag[1]))
+                except (ValueError, AttributeError) as e:
+                    if tolerant_mode:
+                        content.warnings.append(f"Skipping malformed heading element: {e}")
+                    else:
+                        raise
+                    
+        # Add page break between chapters
+        content.append(T_PAGEBREAK)
+        
+    except Exception as e:
+        if tolerant_mode:
+            content.warnings.append(f"Skipping problematic document item: {e}")
+        else:
+            raise
+            
+    return content
+
+def _read_epub(path: str):
+    """Read an EPUB file through a large read buffer.
+    
+    ebooklib hands the file object straight to zipfile, so the many small
+    per-entry reads are served from the buffer instead of hitting the
+    filesystem each time, which matters most on network shares. File
+    objects are only accepted by ebooklib 0.20 and later.
+    """
+    with open(path, 'rb', buffering=_EPUB_READ_BUFFER) as f:
+        return epub.read_epub(f)
+
+@functools.lru_cache(maxsize=1)
+def _read_epub_cached(path: str, signature: Tuple[int, int]):
+    """Read an EPUB file, cached by absolute path and (st_mtime_ns, st_size).
+    
+    Only the most recent book is kept, so a long-running GUI does not pin
+    several fully loaded books in memory.
+    """
+    return _read_epub(path)
+
+def _write_atomic(path: str, data) -> None:
+    """Write data to path via a temporary file and an atomic rename."""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _put_until_stopped(q: queue.Queue, item, stop: threading.Event) -> bool:
+    """Put item on a bounded queue, giving up once stop is set."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _build_streaming(doc: BaseDocTemplate, flowables) -> None:
+    """Build a document from an iterable of flowables, one batch at a time.
+    
+    Mirrors BaseDocTemplate.build as of reportlab 4.x (checked against
+    4.5.1), but pulls flowables lazily instead of requiring the whole story
+    as a list up front. It relies on the same private hooks (_startBuild,
+    _hanging, clean_hanging, canv._doctemplate), so revisit it whenever the
+    reportlab requirement is raised; onProgress callbacks and _traceInfo
+    decoration are not reproduced. handle_flowable consumes from the front
+    of the list, so the buffer is kept at most one batch long to bound the
+    cost of those deletions.
+    """
+    source = iter(flowables)
+    pending = []
+    exhausted = False
+    
+    doc._startBuild()
+    canv = doc.canv
+    saved_info = canv._doc.info
+    try:
+        canv._doctemplate = doc
+        while True:
+            if not exhausted and len(pending) < _FLOWABLE_LOOKAHEAD:
+                # Top the buffer up in place; it never grows past one batch
+                wanted = _FLOWABLE_BATCH_SIZE - len(pending)
+                pending.extend(itertools.islice(source, wanted))
+                exhausted = len(pending) < _FLOWABLE_BATCH_SIZE
+            if not pending:
+                break
+            # A PageBreakIfNotEmpty right after a page begins only switches template
+            if doc._hanging and doc._hanging[-1] is PageBegin and isinstance(pending[0], PageBreakIfNotEmpty):
+                next_template = pending[0].nextTemplate
+                if next_template and not doc._samePT(next_template):
+                    NextPageTemplate(next_template).apply(doc)
+                    doc._setPageTemplate()
+                del pending[0]
+                # Refill before handling, the break may have been the last item
+                continue
+            doc.clean_hanging()
+            doc.handle_flowable(pending)
+    finally:
+        del canv._doctemplate
+        
+    canv._doc.info = saved_info
+    doc._endBuild()
+
 class ConversionError(Exception):
     """Exception raised for errors during EPUB to PDF conversion."""
     pass
@@ -28,11 +307,27 @@ class ConversionError(Exception):
 class EpubToPdfConverter:
     """Main class for converting EPUB files to PDF format."""
     
-    def __init__(self, tolerant_mode: bool = False):
+    def __init__(self, tolerant_mode: bool = False, parse_workers: Optional[int] = 1):
         self.page_size = A4
-        self.styles = getSampleStyleSheet()
+        # Sample stylesheet is built on first render, not for validation only
+        self.styles = None
         self.progress_callback: Optional[Callable[[int], None]] = None
         self.tolerant_mode = tolerant_mode
+        # Worker processes allowed for parsing large books (None: CPU count,
+        # 1: always serial); see _PARALLEL_PARSE_MIN_BYTES
+        self.parse_workers = parse_workers
+        self._styles_built = False
+        self._has_content = False
+        # validate_input results by absolute path: (stat signature, result)
+        self._validate_cache = {}
+        # Render handlers indexed by content kind (T_TITLE .. T_PAGEBREAK)
+        self._handlers = (
+            self._emit_title,
+            self._emit_author,
+            self._emit_heading,
+            self._emit_para,
+            self._emit_pagebreak,
+        )
         
     def set_progress_callback(self, callback: Callable[[int], None]):
         """Set callback function for progress updates."""
@@ -64,17 +359,20 @@ class EpubToPdfConverter:
             if not epub_path.lower().endswith('.epub'):
                 raise ConversionError("Input file must be an EPUB file")
                 
-            # Read EPUB file
+            # Read EPUB file, reusing a cached parse if it is unchanged on disk
             self._update_progress(10)
-            book = epub.read_epub(epub_path)
+            try:
+                st = os.stat(epub_path)
+                book = _read_epub_cached(os.path.abspath(epub_path), (st.st_mtime_ns, st.st_size))
+            except OSError:
+                _read_epub_cached.cache_clear()
+                raise
             
-            # Extract content
+            # Extract content and generate PDF as a pipeline; progress then
+            # advances from 30 to 90 as each document is laid out
             self._update_progress(30)
-            content = self._extract_content(book)
-            
-            # Generate PDF
-            self._update_progress(70)
-            self._generate_pdf(content, output_path, book)
+            total_blocks = 1 + sum(1 for _ in book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
+            self._generate_pdf(self._stream_content(book), output_path, book, total_blocks)
             
             self._update_progress(100)
             return True
@@ -86,110 +384,101 @@ class EpubToPdfConverter:
             else:
                 raise ConversionError(f"Conversion failed: {str(e)}")
             
-    def _extract_content(self, book) -> list:
-        """Extract text content from EPUB book."""
-        content = []
-        
+    def _iter_content(self, book):
+        """Yield text content from EPUB book in reading order, one block per document."""
         # Get book metadata
         title = book.get_metadata('DC', 'title')[0][0] if book.get_metadata('DC', 'title') else 'Unknown Title'
         author = book.get_metadata('DC', 'creator')[0][0] if book.get_metadata('DC', 'creator') else 'Unknown Author'
         
-        content.append({'type': 'title', 'text': title})
-        content.append({'type': 'author', 'text': f'by {author}'})
-        content.append({'type': 'pagebreak', 'text': ''})
+        front_matter = Content()
+        front_matter.append(T_TITLE, title)
+        front_matter.append(T_AUTHOR, f'by {author}')
+        front_matter.append(T_PAGEBREAK)
+        yield front_matter
         
-        # Process each item in the book
-        for item in book.get_items():
-            if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                try:
-                    # Parse HTML content
-                    soup = BeautifulSoup(item.get_content(), 'html.parser')
-                    
-                    # Extract text from various HTML elements
-                    for element in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                        try:
-                            content.append({
-                                'type': 'heading', 
-                                'text': element.get_text().strip(),
-                                'level': int(element.name[1])
-                            })
-                        except (ValueError, AttributeError) as e:
-                            if self.tolerant_mode:
-                                logger.warning(f"Skipping malformed heading element: {e}")
-                            else:
-                                raise
-                                
-                    for element in soup.find_all('p'):
-                        try:
-                            # Handle paragraphs that may contain problematic img tags or other elements
-                            text = self._extract_paragraph_text(element)
-                            if text:
-                                content.append({'type': 'paragraph', 'text': text})
-                        except Exception as e:
-                            if self.tolerant_mode:
-                                logger.warning(f"Skipping problematic paragraph: {e}")
-                                # Try to extract just the text content ignoring HTML structure
-                                try:
-                                    text = element.get_text().strip()
-                                    if text:
-                                        content.append({'type': 'paragraph', 'text': text})
-                                except Exception as e2:
-                                    logger.warning(f"Could not extract any text from paragraph: {e2}")
-                            else:
-                                raise
-                                
-                    # Add page break between chapters
-                    content.append({'type': 'pagebreak', 'text': ''})
-                    
-                except Exception as e:
-                    if self.tolerant_mode:
-                        logger.warning(f"Skipping problematic document item: {e}")
-                    else:
-                        raise
+        # Each document item is parsed independently
+        items = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
+        tolerant_mode = self.tolerant_mode
+        payloads = ((item.get_content(), tolerant_mode) for item in items)
+        
+        # Sized from the raw bytes; get_content() re-serializes each chapter
+        # and is left to the payloads so it runs once per document
+        if (self.parse_workers == 1 or len(items) < 2
+                or sum(len(item.content or b'') for item in items) < _PARALLEL_PARSE_MIN_BYTES):
+            blocks = map(_parse_one_doc, payloads)
+        else:
+            blocks = self._parse_in_pool(payloads)
+            
+        for block in blocks:
+            for message in block.warnings:
+                logger.warning(message)
+            yield block
+            
+    def _parse_in_pool(self, payloads):
+        """Parse documents in worker processes, yielding results in spine order.
+        
+        Only a few documents per worker are in flight at once, so results
+        are handed on at the pace the consumer takes them.
+        """
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as executor:
+            window = 2 * (self.parse_workers or os.cpu_count() or 1)
+            pending = collections.deque(
+                executor.submit(_parse_one_doc, payload)
+                for payload in itertools.islice(payloads, window)
+            )
+            while pending:
+                result = pending.popleft().result()
+                for payload in itertools.islice(payloads, 1):
+                    pending.append(executor.submit(_parse_one_doc, payload))
+                yield result
                 
-        return content
-    
-    def _extract_paragraph_text(self, element):
-        """Extract text from paragraph element, handling malformed HTML gracefully."""
-        try:
-            # First try to get clean text
-            text = element.get_text().strip()
-            if text:
-                return text
-        except Exception as e:
-            if self.tolerant_mode:
-                logger.warning(f"Error extracting paragraph text: {e}")
-                # Try alternative extraction methods
-                try:
-                    # Try to extract just the string content
-                    text_parts = []
-                    for content in element.contents:
-                        if hasattr(content, 'get_text'):
-                            text_parts.append(content.get_text())
-                        elif isinstance(content, str):
-                            text_parts.append(content)
-                    return ' '.join(text_parts).strip()
-                except Exception as e2:
-                    logger.warning(f"Alternative text extraction also failed: {e2}")
-                    return None
-            else:
-                raise
+    def _stream_content(self, book):
+        """Yield content blocks while a background thread parses the book.
         
-    def _generate_pdf(self, content: list, output_path: str, book) -> None:
-        """Generate PDF from extracted content."""
-        # Create document
-        doc = SimpleDocTemplate(
-            output_path,
-            pagesize=self.page_size,
-            rightMargin=inch,
-            leftMargin=inch,
-            topMargin=inch,
-            bottomMargin=inch
-        )
+        Parsing of later chapters overlaps with PDF layout of earlier ones;
+        the bounded queue keeps memory proportional to a chapter, not the book.
+        """
+        content_queue = queue.Queue(maxsize=_CONTENT_QUEUE_SIZE)
+        stop = threading.Event()
         
-        # Prepare styles
+        def produce():
+            items = self._iter_content(book)
+            try:
+                for item in items:
+                    if not _put_until_stopped(content_queue, item, stop):
+                        return
+            except Exception as e:
+                _put_until_stopped(content_queue, e, stop)
+            finally:
+                items.close()
+                _put_until_stopped(content_queue, _END_OF_CONTENT, stop)
+                
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = content_queue.get()
+                if item is _END_OF_CONTENT:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+            
+    def _build_styles(self) -> None:
+        """Build the paragraph styles used for rendering, once per converter.
+        
+        Reset ``_styles_built`` to force a rebuild after changing ``styles``.
+        """
+        if self._styles_built:
+            return
+            
+        if self.styles is None:
+            self.styles = getSampleStyleSheet()
         styles = self.styles
-        title_style = ParagraphStyle(
+        self._title_style = ParagraphStyle(
             'CustomTitle',
             parent=styles['Title'],
             fontSize=24,
@@ -197,7 +486,7 @@ class EpubToPdfConverter:
             alignment=TA_CENTER
         )
         
-        author_style = ParagraphStyle(
+        self._author_style = ParagraphStyle(
             'CustomAuthor',
             parent=styles['Normal'],
             fontSize=16,
@@ -206,13 +495,13 @@ class EpubToPdfConverter:
             textColor='gray'
         )
         
-        heading_styles = {
+        self._heading_styles = {
             1: ParagraphStyle('Heading1', parent=styles['Heading1'], fontSize=18, spaceAfter=12),
             2: ParagraphStyle('Heading2', parent=styles['Heading2'], fontSize=16, spaceAfter=10),
             3: ParagraphStyle('Heading3', parent=styles['Heading3'], fontSize=14, spaceAfter=8),
         }
         
-        paragraph_style = ParagraphStyle(
+        self._paragraph_style = ParagraphStyle(
             'CustomParagraph',
             parent=styles['Normal'],
             fontSize=11,
@@ -220,59 +509,107 @@ class EpubToPdfConverter:
             alignment=TA_JUSTIFY
         )
         
-        # Build document content
-        story = []
+        self._styles_built = True
         
-        for item in content:
-            try:
-                if item['type'] == 'title':
-                    story.append(Paragraph(item['text'], title_style))
-                    story.append(Spacer(1, 12))
-                    
-                elif item['type'] == 'author':
-                    story.append(Paragraph(item['text'], author_style))
-                    story.append(Spacer(1, 12))
-                    
-                elif item['type'] == 'heading':
-                    level = min(item.get('level', 1), 3)
-                    style = heading_styles.get(level, heading_styles[1])
-                    story.append(Spacer(1, 12))
-                    story.append(Paragraph(item['text'], style))
-                    story.append(Spacer(1, 6))
-                    
-                elif item['type'] == 'paragraph':
-                    # Clean up text
-                    text = item['text'].replace('\n', ' ').replace('\r', '')
-                    text = ' '.join(text.split())  # Normalize whitespace
-                    if text:
-                        # Escape problematic characters for ReportLab
-                        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                        story.append(Paragraph(text, paragraph_style))
-                        
-                elif item['type'] == 'pagebreak':
-                    if story:  # Only add page break if there's content
-                        story.append(PageBreak())
-                        
-            except Exception as e:
-                if self.tolerant_mode:
-                    logger.warning(f"Skipping problematic content item: {e}")
-                else:
-                    raise
-                    
+    def _emit_title(self, text: str, level: int, story: list) -> None:
+        """Append flowables for the book title."""
+        story.append(Paragraph(text, self._title_style))
+        story.append(Spacer(1, 12))
+        self._has_content = True
+        
+    def _emit_author(self, text: str, level: int, story: list) -> None:
+        """Append flowables for the author line."""
+        story.append(Paragraph(text, self._author_style))
+        story.append(Spacer(1, 12))
+        self._has_content = True
+        
+    def _emit_heading(self, text: str, level: int, story: list) -> None:
+        """Append flowables for a heading, using H3 style for deeper levels."""
+        style = self._heading_styles.get(min(level, 3), self._heading_styles[1])
+        story.append(Spacer(1, 12))
+        story.append(Paragraph(text, style))
+        story.append(Spacer(1, 6))
+        self._has_content = True
+        
+    def _emit_para(self, text: str, level: int, story: list) -> None:
+        """Append a body paragraph; text was already normalized during extraction."""
+        if text:
+            # Escape problematic characters for ReportLab
+            story.append(Paragraph(text.translate(_ESCAPE_TABLE), self._paragraph_style))
+            self._has_content = True
+            
+    def _emit_pagebreak(self, text: str, level: int, story: list) -> None:
+        """Append a page break between chapters."""
+        if self._has_content:  # Only add page break if there's content
+            story.append(PageBreak())
+            
+    def _generate_pdf(self, content, output_path: str, book, total_blocks: int = 0) -> None:
+        """Generate PDF from extracted content.
+        
+        Args:
+            content: Iterable of Content blocks; consumed lazily
+            output_path: Path for output PDF file
+            book: Source EPUB book
+            total_blocks: Expected number of blocks, for progress from 30 to 90
+        """
+        # Create document, rendered in memory and written out in one go
+        buffer = io.BytesIO()
+        doc = BaseDocTemplate(
+            buffer,
+            pagesize=self.page_size,
+            rightMargin=inch,
+            leftMargin=inch,
+            topMargin=inch,
+            bottomMargin=inch
+        )
+        frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='normal')
+        doc.addPageTemplates([PageTemplate(id='main', frames=[frame], pagesize=self.page_size)])
+        
+        # Prepare styles
+        self._build_styles()
+        self._has_content = False
+        
+        # Build document content lazily so layout starts before parsing ends,
+        # one block (document) of flowables at a time
+        def iter_story():
+            handlers = self._handlers
+            story = []
+            last_progress = 30
+            for done, block in enumerate(content, 1):
+                for kind, text, level in block:
+                    try:
+                        handlers[kind](text, level, story)
+                    except Exception as e:
+                        if self.tolerant_mode:
+                            logger.warning(f"Skipping problematic content item: {e}")
+                        else:
+                            raise
+                yield from story
+                story.clear()
+                if total_blocks:
+                    progress = 30 + 60 * min(done, total_blocks) // total_blocks
+                    if progress != last_progress:
+                        last_progress = progress
+                        self._update_progress(progress)
+                
         # Build PDF
         try:
-            doc.build(story)
+            _build_streaming(doc, iter_story())
         except Exception as e:
             if self.tolerant_mode:
                 logger.warning(f"PDF generation completed with warnings: {e}")
                 # Try to build with minimal content if the full build fails
                 try:
-                    minimal_story = [Paragraph("PDF conversion completed with some content skipped due to formatting issues.", paragraph_style)]
+                    buffer.seek(0)
+                    buffer.truncate()
+                    minimal_story = [Paragraph("PDF conversion completed with some content skipped due to formatting issues.", self._paragraph_style)]
                     doc.build(minimal_story)
                 except Exception as e2:
                     raise ConversionError(f"Failed to generate PDF even in tolerant mode: {e2}")
             else:
                 raise
+                
+        _write_atomic(output_path, buffer.getbuffer())
         
     def get_supported_formats(self) -> list:
         """Get list of supported input formats."""
@@ -281,24 +618,48 @@ class EpubToPdfConverter:
     def validate_input(self, file_path: str) -> tuple[bool, str]:
         """Validate input file.
         
+        Only the ZIP central directory is read; the EPUB content itself is
+        parsed later by convert(). Results are cached until the file's
+        modification time or size changes.
+        
         Returns:
             tuple: (is_valid, error_message)
         """
-        if not os.path.exists(file_path):
+        try:
+            st = os.stat(file_path)
+        except OSError:
             return False, "File does not exist"
             
         if not file_path.lower().endswith('.epub'):
             return False, "File must be an EPUB file"
             
+        abs_path = os.path.abspath(file_path)
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._validate_cache.get(abs_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+            
+        result = self._check_epub_archive(file_path)
+        self._validate_cache[abs_path] = (signature, result)
+        return result
+        
+    def _check_epub_archive(self, file_path: str) -> tuple[bool, str]:
+        """Check the ZIP structure required of an EPUB file."""
         try:
-            epub.read_epub(file_path)
+            with zipfile.ZipFile(file_path) as zf:
+                names = zf.namelist()
+            if 'META-INF/container.xml' not in names:
+                return False, "Not a valid EPUB (no container.xml)"
+            if not any(name.endswith('.opf') for name in names):
+                return False, "Missing OPF package document"
             return True, ""
         except Exception as e:
             return False, f"Invalid EPUB file: {str(e)}"
 
 def convert_epub_to_pdf(epub_path: str, pdf_path: str, 
                        progress_callback: Optional[Callable[[int], None]] = None,
-                       tolerant_mode: bool = False) -> bool:
+                       tolerant_mode: bool = False,
+                       parse_workers: Optional[int] = 1) -> bool:
     """Convenience function to convert EPUB to PDF.
     
     Args:
@@ -306,11 +667,12 @@ def convert_epub_to_pdf(epub_path: str, pdf_path: str,
         pdf_path: Path for output PDF file
         progress_callback: Optional callback for progress updates
         tolerant_mode: Enable tolerant mode for error handling
+        parse_workers: Worker processes allowed for parsing large books
         
     Returns:
         bool: True if successful, False otherwise
     """
-    converter = EpubToPdfConverter(tolerant_mode=tolerant_mode)
+    converter = EpubToPdfConverter(tolerant_mode=tolerant_mode, parse_workers=parse_workers)
     if progress_callback:
         converter.set_progress_callback(progress_callback)
         
@@ -318,3 +680,42 @@ def convert_epub_to_pdf(epub_path: str, pdf_path: str,
         return converter.convert(epub_path, pdf_path)
     except ConversionError:
         return False
+
+def convert_many(pairs: Iterable[Tuple[str, str]], workers: Optional[int] = None,
+                 progress: Optional[Callable[[int], None]] = None,
+                 tolerant_mode: bool = False) -> List[bool]:
+    """Convert several EPUB files to PDF in parallel worker processes.
+    
+    Each book is converted in its own process with serial document parsing,
+    so the pool size alone bounds CPU use.
+    
+    Args:
+        pairs: (epub_path, pdf_path) tuples to convert
+        workers: Number of worker processes (default: CPU count)
+        progress: Optional callback for overall progress updates
+        tolerant_mode: Enable tolerant mode for error handling
+        
+    Returns:
+        list: Success flag for each pair, in input order
+    """
+    pairs = list(pairs)
+    results = [False] * len(pairs)
+    if not pairs:
+        return results
+        
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(convert_epub_to_pdf, epub_path, pdf_path,
+                            tolerant_mode=tolerant_mode, parse_workers=1): index
+            for index, (epub_path, pdf_path) in enumerate(pairs)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                logger.warning(f"Conversion of {pairs[index][0]} failed: {e}")
+            if progress:
+                progress(done * 100 // len(pairs))
+                
+    return results
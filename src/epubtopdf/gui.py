@@ -3,38 +3,84 @@ This module provides a user-friendly graphical interface for converting
 EPUB files to PDF format using Tkinter.
 """
 import os
+import json
+import queue
+import logging
+import tempfile
 import threading
+import collections
 from pathlib import Path
-from tkinter import *
+import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
-from .converter import EpubToPdfConverter, ConversionError
+
+logger = logging.getLogger(__name__)
+
+# File dialog filters
+_EPUB_FILETYPES = (("EPUB files", "*.epub"), ("All files", "*.*"))
+_PDF_FILETYPES = (("PDF files", "*.pdf"), ("All files", "*.*"))
+
+def _get_converter_cls():
+    """Import the converter (ebooklib, reportlab, lxml) on first use."""
+    from .converter import EpubToPdfConverter
+    return EpubToPdfConverter
 
 class EpubToPdfGUI:
     """Main GUI class for EPUB to PDF converter application."""
     
+    # Lines kept in the log widget; the full history goes to the log file
+    MAX_LOG_LINES = 2000
+    
+    # Log files kept in the settings directory; only logs with warnings are kept
+    MAX_LOG_FILES = 10
+    
     def __init__(self):
-        self.window = Tk()
+        self.window = tk.Tk()
         self.window.title("EPUB to PDF Converter v1.0")
         self.window.geometry("600x550")
         self.window.resizable(True, True)
         
-        # Initialize converter
-        self.converter = EpubToPdfConverter()
+        # Pick the theme before creating widgets so they are styled only once
+        ttk.Style(self.window).theme_use('clam')
+        
+        # Converter is created on first access, see the converter property
+        self._converter = None
+        self._has_tolerant = False
         
         # Variables
-        self.epub_path = StringVar()
-        self.pdf_path = StringVar()
-        self.progress_var = IntVar()
-        self.status_text = StringVar(value="Ready to convert EPUB files")
-        self.tolerant_mode = BooleanVar(value=False)  # New tolerant mode variable
+        self.epub_path = tk.StringVar()
+        self.pdf_path = tk.StringVar()
+        self.progress_var = tk.IntVar()
+        self.status_text = tk.StringVar(value="Ready to convert EPUB files")
+        self.tolerant_mode = tk.BooleanVar(value=False)  # New tolerant mode variable
+        
+        # Pending log lines, flushed to the log widget in batches
+        self._log_queue = collections.deque()
+        self._log_pending = False
+        self._log_lock = threading.Lock()
+        self.log_file_path = self._open_log_file()
+        
+        # Messages from the conversion thread, applied by _drain on the Tk loop
+        self._ui_q = queue.Queue()
+        
+        # Last-used dialog directories, persisted between sessions
+        self._last_epub_dir = None
+        self._last_pdf_dir = None
+        self._load_settings()
+        
+        # Latest progress/status values, applied once per idle cycle
+        self._pending_progress = None
+        self._pending_status = None
+        self._redraw_scheduled = False
+        self._pending_lock = threading.Lock()
         
         # Create GUI components
         self.create_widgets()
-        self.setup_layout()
         
     def create_widgets(self):
         """Create all GUI widgets."""
+        W, E, N, S = tk.W, tk.E, tk.N, tk.S
+        
         # Main frame
         main_frame = ttk.Frame(self.window, padding="10")
         main_frame.grid(row=0, column=0, sticky=(W, E, N, S))
@@ -96,19 +142,17 @@ class EpubToPdfGUI:
         self.status_label = ttk.Label(
             main_frame, 
             textvariable=self.status_text, 
-            relief=SUNKEN
+            relief=tk.SUNKEN
         )
         self.status_label.grid(row=6, column=0, columnspan=3, sticky=(W, E), pady=(10, 0))
         
-        # Log text area
-        ttk.Label(main_frame, text="Log:").grid(row=7, column=0, sticky=NW, pady=(10, 5))
-        self.log_text = ScrolledText(
-            main_frame, 
-            height=10, 
-            width=70, 
-            wrap=WORD
-        )
-        self.log_text.grid(row=7, column=1, columnspan=2, padx=(10, 0), pady=(10, 0), sticky=(W, E, N, S))
+        # Log text area; the ScrolledText is created on first use by
+        # _ensure_log_widget, a label showing the startup lines holds its
+        # place until then
+        ttk.Label(main_frame, text="Log:").grid(row=7, column=0, sticky=tk.NW, pady=(10, 5))
+        self.log_text = None
+        self._log_placeholder = ttk.Label(main_frame, anchor=tk.NW, justify=tk.LEFT)
+        self._log_placeholder.grid(row=7, column=1, columnspan=2, padx=(10, 0), pady=(10, 0), sticky=(W, E, N, S))
         
         # Configure grid weights for resizing
         self.window.columnconfigure(0, weight=1)
@@ -117,55 +161,264 @@ class EpubToPdfGUI:
         main_frame.rowconfigure(7, weight=1)
         
     def setup_layout(self):
-        """Set up the layout and styling."""
-        # Add some styling
-        style = ttk.Style()
-        style.theme_use('clam')
+        """Set up the layout and styling.
+        
+        Kept for compatibility; the theme is now applied in __init__, before
+        any widget is created.
+        """
         
     def browse_epub_file(self):
         """Open file dialog to select EPUB file."""
         file_path = filedialog.askopenfilename(
             title="Select EPUB File",
-            filetypes=[("EPUB files", "*.epub"), ("All files", "*.*")]
+            initialdir=self._last_epub_dir,
+            filetypes=_EPUB_FILETYPES
         )
         if file_path:
+            self._last_epub_dir = str(Path(file_path).parent)
+            self._save_settings()
             self.epub_path.set(file_path)
             # Auto-generate PDF filename
             epub_file = Path(file_path)
             pdf_file = epub_file.with_suffix('.pdf')
             self.pdf_path.set(str(pdf_file))
             self.log_message(f"Selected EPUB file: {file_path}")
+            # Validate in the background so the check at convert time is cached
+            threading.Thread(
+                target=self.converter.validate_input,
+                args=(file_path,),
+                daemon=True
+            ).start()
             
     def browse_pdf_file(self):
         """Open file dialog to select PDF output location."""
         file_path = filedialog.asksaveasfilename(
             title="Save PDF As",
             defaultextension=".pdf",
-            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
+            initialdir=self._last_pdf_dir,
+            filetypes=_PDF_FILETYPES
         )
         if file_path:
+            self._last_pdf_dir = str(Path(file_path).parent)
+            self._save_settings()
             self.pdf_path.set(file_path)
             self.log_message(f"PDF output set to: {file_path}")
             
+    def _settings_path(self):
+        """Return the path of the settings file."""
+        return Path.home() / '.epubtopdf' / 'last.json'
+        
+    def _load_settings(self):
+        """Load last-used directories; a missing or bad file is ignored."""
+        try:
+            with open(self._settings_path(), encoding='utf-8') as f:
+                settings = json.load(f)
+            self._last_epub_dir = settings.get('epub_dir')
+            self._last_pdf_dir = settings.get('pdf_dir')
+        except (OSError, RuntimeError, ValueError, AttributeError):
+            pass
+            
+    def _save_settings(self):
+        """Save last-used directories atomically, on a best-effort basis."""
+        settings = {'epub_dir': self._last_epub_dir, 'pdf_dir': self._last_pdf_dir}
+        try:
+            settings_path = self._settings_path()
+            settings_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = settings_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(settings, f)
+            os.replace(tmp_path, settings_path)
+        except (OSError, RuntimeError):
+            pass
+            
+    def _open_log_file(self):
+        """Mirror the log, including converter warnings, to a log file.
+        
+        Each window gets its own uniquely named file under the per-user
+        settings directory, so concurrent instances never share one. The
+        handler is removed again by _close_log_file, which also deletes the
+        file if nothing at WARNING or above was logged to it.
+        
+        Returns:
+            str: Path of the log file, or None if it could not be opened
+        """
+        self._log_handler = None
+        self._saved_log_level = None
+        try:
+            log_dir = self._settings_path().parent
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_log_files(log_dir)
+            fd, log_path = tempfile.mkstemp(prefix='epubtopdf-', suffix='.log', dir=log_dir)
+            os.close(fd)
+            handler = logging.FileHandler(log_path, mode='w', encoding='utf-8')
+        except (OSError, RuntimeError):
+            return None
+        handler.setLevel(logging.INFO)
+        handler.addFilter(self._note_warning)
+        self._log_has_warnings = False
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+        package_logger = logging.getLogger('epubtopdf')
+        package_logger.addHandler(handler)
+        # Let INFO records through only if nothing more verbose is configured
+        if package_logger.getEffectiveLevel() > logging.INFO:
+            self._saved_log_level = package_logger.level
+            package_logger.setLevel(logging.INFO)
+        self._log_handler = handler
+        return log_path
+        
+    def _close_log_file(self):
+        """Detach and close the log file handler added by _open_log_file."""
+        handler = self._log_handler
+        if handler is None:
+            return
+        self._log_handler = None
+        package_logger = logging.getLogger('epubtopdf')
+        package_logger.removeHandler(handler)
+        handler.close()
+        if self._saved_log_level is not None:
+            package_logger.setLevel(self._saved_log_level)
+            self._saved_log_level = None
+        # A log without warnings has nothing worth keeping
+        if not self._log_has_warnings:
+            try:
+                os.remove(handler.baseFilename)
+            except OSError:
+                pass
+                
+    def _note_warning(self, record):
+        """Handler filter that remembers whether a warning reached the log file."""
+        if record.levelno >= logging.WARNING:
+            self._log_has_warnings = True
+        return True
+        
+    def _prune_log_files(self, log_dir):
+        """Delete all but the newest MAX_LOG_FILES - 1 kept log files."""
+        try:
+            logs = sorted(log_dir.glob('epubtopdf-*.log'), key=lambda p: p.stat().st_mtime, reverse=True)
+        except OSError:
+            return
+        for old_log in logs[self.MAX_LOG_FILES - 1:]:
+            try:
+                old_log.unlink()
+            except OSError:
+                pass
+        
+    def _ensure_log_widget(self):
+        """Create the log text area in place of its placeholder (main thread only)."""
+        if self.log_text is not None:
+            return
+        W, E, N, S = tk.W, tk.E, tk.N, tk.S
+        main_frame = self._log_placeholder.master
+        startup_text = self._log_placeholder.cget('text')
+        self._log_placeholder.destroy()
+        self._log_placeholder = None
+        self.log_text = ScrolledText(
+            main_frame, 
+            height=10, 
+            width=70, 
+            wrap=tk.WORD
+        )
+        self.log_text.grid(row=7, column=1, columnspan=2, padx=(10, 0), pady=(10, 0), sticky=(W, E, N, S))
+        # Carry over the startup lines shown by the placeholder
+        if startup_text:
+            self.log_text.insert(tk.END, f"{startup_text}\n")
+            
+    def _log_startup(self, message):
+        """Show a startup line in the log placeholder without creating the log widget."""
+        if self.log_text is not None:
+            self.log_message(message)
+            return
+        logger.info(message)
+        text = self._log_placeholder.cget('text')
+        self._log_placeholder.config(text=f"{text}\n{message}" if text else message)
+        
+    @property
+    def converter(self):
+        """Converter instance, created (and its module imported) on first access."""
+        if self._converter is None:
+            converter_cls = _get_converter_cls()
+            # Whether the converter reports skipped elements, checked once
+            self._has_tolerant = hasattr(converter_cls, 'convert_with_tolerant_mode')
+            self._converter = converter_cls()
+        return self._converter
+        
     def log_message(self, message):
-        """Add message to log text area."""
-        self.log_text.insert(END, f"{message}\n")
-        self.log_text.see(END)
+        """Queue message for the log text area.
+        
+        Safe to call from the conversion thread: lines are batched and the
+        widget itself is only touched by _flush_log on the Tk main loop.
+        """
+        logger.info(message)
+        with self._log_lock:
+            self._log_queue.append(f"{message}\n")
+            if self._log_pending:
+                return
+            self._log_pending = True
+        self.window.after(50, self._flush_log)
+        
+    def _flush_log(self):
+        """Write all queued log lines to the log text area at once."""
+        with self._log_lock:
+            batch = []
+            while self._log_queue:
+                batch.append(self._log_queue.popleft())
+            self._log_pending = False
+        if batch:
+            self._ensure_log_widget()
+            self.log_text.insert(tk.END, "".join(batch))
+            # Drop the oldest lines beyond the cap in a single delete
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            excess = line_count - self.MAX_LOG_LINES
+            if excess > 0:
+                self.log_text.delete('1.0', f'{excess + 1}.0')
+            self.log_text.see(tk.END)
         
     def update_progress(self, progress):
         """Update progress bar."""
-        self.progress_var.set(progress)
-        self.window.update_idletasks()
+        with self._pending_lock:
+            self._pending_progress = progress
+        self._schedule_redraw()
         
     def update_status(self, status):
         """Update status label."""
-        self.status_text.set(status)
-        self.window.update_idletasks()
+        with self._pending_lock:
+            self._pending_status = status
+        self._schedule_redraw()
         
-    def validate_inputs(self):
-        """Validate input fields."""
-        epub_file = self.epub_path.get().strip()
-        pdf_file = self.pdf_path.get().strip()
+    def _schedule_redraw(self):
+        """Schedule _apply_pending once, coalescing rapid updates."""
+        with self._pending_lock:
+            if self._redraw_scheduled:
+                return
+            self._redraw_scheduled = True
+        self.window.after_idle(self._apply_pending)
+        
+    def _apply_pending(self):
+        """Apply the latest progress/status values on the Tk main loop.
+        
+        Setting the variables marks the widgets dirty; Tk redraws them on its
+        next idle pass, so no forced update_idletasks() is needed.
+        """
+        with self._pending_lock:
+            progress, self._pending_progress = self._pending_progress, None
+            status, self._pending_status = self._pending_status, None
+            self._redraw_scheduled = False
+        if progress is not None and progress != self.progress_var.get():
+            self.progress_var.set(progress)
+        if status is not None and status != self.status_text.get():
+            self.status_text.set(status)
+        
+    def validate_inputs(self, epub_file=None, pdf_file=None):
+        """Validate input fields.
+        
+        Args:
+            epub_file: Already-read EPUB path (default: read from the entry)
+            pdf_file: Already-read PDF path (default: read from the entry)
+        """
+        if epub_file is None:
+            epub_file = self.epub_path.get().strip()
+        if pdf_file is None:
+            pdf_file = self.pdf_path.get().strip()
         
         if not epub_file:
             messagebox.showerror("Error", "Please select an EPUB file.")
@@ -189,15 +442,21 @@ class EpubToPdfGUI:
         
     def start_conversion(self):
         """Start the conversion process in a separate thread."""
-        if not self.validate_inputs():
+        # Read the Tk variables once, here on the main thread
+        epub_file = self.epub_path.get().strip()
+        pdf_file = self.pdf_path.get().strip()
+        tolerant_enabled = self.tolerant_mode.get()
+        
+        if not self.validate_inputs(epub_file, pdf_file):
             return
             
+        self._ensure_log_widget()
+        
         # Disable convert button during conversion
         self.convert_button.config(state='disabled')
         self.progress_var.set(0)
         
         # Set tolerant mode based on checkbox
-        tolerant_enabled = self.tolerant_mode.get()
         if tolerant_enabled:
             self.update_status("Starting tolerant conversion...")
             self.log_message("=== Starting Tolerant EPUB to PDF Conversion ===")
@@ -207,12 +466,20 @@ class EpubToPdfGUI:
             self.log_message("=== Starting EPUB to PDF Conversion ===")
         
         # Start conversion in separate thread to prevent GUI freezing
-        conversion_thread = threading.Thread(target=self.perform_conversion)
+        conversion_thread = threading.Thread(
+            target=self.perform_conversion,
+            args=(epub_file, pdf_file, tolerant_enabled)
+        )
         conversion_thread.daemon = True
         conversion_thread.start()
         
-    def show_conversion_results(self, success, skipped_count=0, log_file_path=None):
-        """Show conversion results with improved error reporting."""
+    def show_conversion_results(self, success, skipped_count=0, log_file_path=None,
+                                tolerant_enabled=False):
+        """Show conversion results with improved error reporting.
+        
+        tolerant_enabled is the tolerant mode the conversion actually ran
+        with, not the checkbox's current state.
+        """
         if success:
             if skipped_count > 0:
                 message = (f"Conversion completed successfully!\n\n"
@@ -222,7 +489,7 @@ class EpubToPdfGUI:
             else:
                 messagebox.showinfo("Success", "EPUB file has been successfully converted to PDF!")
         else:
-            if self.tolerant_mode.get() and skipped_count > 0:
+            if tolerant_enabled and skipped_count > 0:
                 message = (f"Conversion failed!\n\n"
                           f"{skipped_count} elements were skipped, but conversion still failed.\n"
                           f"Check the log file for details: {log_file_path}")
@@ -230,74 +497,128 @@ class EpubToPdfGUI:
                 message = "Conversion failed. Please check the log for details."
             messagebox.showerror("Conversion Failed", message)
         
-    def perform_conversion(self):
-        """Perform the actual conversion."""
-        epub_file = self.epub_path.get().strip()
-        pdf_file = self.pdf_path.get().strip()
+    def perform_conversion(self, epub_file, pdf_file, tolerant_enabled):
+        """Perform the actual conversion on the worker thread.
+        
+        Tk is not thread-safe, so this never touches widgets or Tk variables:
+        the inputs are read by start_conversion, and every UI update is posted
+        to the queue that _drain applies on the Tk main loop.
+        """
+        # Already loaded by validate_inputs via the converter property
+        from .converter import ConversionError
         
         try:
             # Set progress callback
-            self.converter.set_progress_callback(self.update_progress)
-            
-            # Set tolerant mode in converter
-            tolerant_enabled = self.tolerant_mode.get()
+            self.converter.set_progress_callback(lambda progress: self._post('progress', progress))
             
             # Perform conversion
-            self.log_message(f"Converting '{epub_file}' to '{pdf_file}'...")
+            self._post('log', f"Converting '{epub_file}' to '{pdf_file}'...")
             if tolerant_enabled:
-                self.log_message("Tolerant mode: skipping problematic elements")
+                self._post('log', "Tolerant mode: skipping problematic elements")
             
             # Note: This assumes the converter has been updated to support tolerant mode
             # The converter should return (success, skipped_count, log_file_path)
-            if hasattr(self.converter, 'convert_with_tolerant_mode') and tolerant_enabled:
+            if self._has_tolerant and tolerant_enabled:
                 result = self.converter.convert_with_tolerant_mode(epub_file, pdf_file)
                 if isinstance(result, tuple) and len(result) == 3:
                     success, skipped_count, log_file_path = result
                 else:
                     success = result
                     skipped_count = 0
-                    log_file_path = None
+                    log_file_path = self.log_file_path
             else:
                 success = self.converter.convert(epub_file, pdf_file)
                 skipped_count = 0
-                log_file_path = None
-                
-            # Update status and show results
-            if success:
-                if skipped_count > 0:
-                    self.log_message(f"Conversion completed with {skipped_count} elements skipped!")
-                    self.update_status(f"Conversion completed with {skipped_count} warnings!")
-                else:
-                    self.log_message("Conversion completed successfully!")
-                    self.update_status("Conversion completed successfully!")
-            else:
-                self.log_message("Conversion failed!")
-                self.update_status("Conversion failed!")
+                log_file_path = self.log_file_path
                 
-            # Show detailed results dialog
-            self.show_conversion_results(success, skipped_count, log_file_path)
+            self._post('done', success, skipped_count, log_file_path, tolerant_enabled)
                 
         except ConversionError as e:
             error_msg = str(e)
-            self.log_message(f"Conversion error: {error_msg}")
-            self.update_status(f"Error: {error_msg}")
-            messagebox.showerror("Conversion Error", error_msg)
+            self._post('error', "Conversion Error", f"Conversion error: {error_msg}",
+                       f"Error: {error_msg}", error_msg)
             
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
-            self.log_message(error_msg)
-            self.update_status(error_msg)
-            messagebox.showerror("Error", error_msg)
+            self._post('error', "Error", error_msg, error_msg, error_msg)
             
+    def _post(self, *message):
+        """Queue a UI update from the conversion thread."""
+        self._ui_q.put(message)
+        
+    def _drain(self):
+        """Apply queued UI updates on the Tk main loop, then reschedule.
+        
+        The next run is scheduled even if a handler raises, so one failing
+        update (e.g. a TclError from a dialog) cannot stop the pump.
+        """
+        try:
+            while True:
+                try:
+                    tag, *args = self._ui_q.get_nowait()
+                except queue.Empty:
+                    break
+                if tag == 'log':
+                    self.log_message(*args)
+                elif tag == 'status':
+                    self.update_status(*args)
+                elif tag == 'progress':
+                    self.update_progress(*args)
+                elif tag == 'done':
+                    self._finish_conversion(*args)
+                elif tag == 'error':
+                    self._fail_conversion(*args)
         finally:
-            # Re-enable convert button
-            self.convert_button.config(state='normal')
+            self.window.after(50, self._drain)
+        
+    def _finish_conversion(self, success, skipped_count, log_file_path, tolerant_enabled):
+        """Report a finished conversion and re-enable the convert button."""
+        # Update status and show results
+        if success:
+            if skipped_count > 0:
+                self.log_message(f"Conversion completed with {skipped_count} elements skipped!")
+                self.update_status(f"Conversion completed with {skipped_count} warnings!")
+            else:
+                self.log_message("Conversion completed successfully!")
+                self.update_status("Conversion completed successfully!")
+        else:
+            self.log_message("Conversion failed!")
+            self.update_status("Conversion failed!")
             
+        # Show detailed results dialog
+        try:
+            self._flush_before_dialog()
+            self.show_conversion_results(success, skipped_count, log_file_path, tolerant_enabled)
+        finally:
+            self.convert_button.config(state='normal')
+        
+    def _fail_conversion(self, title, log_msg, status_msg, error_msg):
+        """Report a conversion error and re-enable the convert button."""
+        self.log_message(log_msg)
+        self.update_status(status_msg)
+        try:
+            self._flush_before_dialog()
+            messagebox.showerror(title, error_msg)
+        finally:
+            self.convert_button.config(state='normal')
+        
+    def _flush_before_dialog(self):
+        """Draw pending progress/status once before a modal dialog opens.
+        
+        This is the only forced flush: update_idletasks() also runs the
+        after_idle callback queued by _schedule_redraw.
+        """
+        self.window.update_idletasks()
+        
     def run(self):
         """Start the GUI application."""
-        self.log_message("EPUB to PDF Converter v1.0 initialized")
-        self.log_message("Select an EPUB file to begin conversion")
-        self.window.mainloop()
+        self._log_startup("EPUB to PDF Converter v1.0 initialized")
+        self._log_startup("Select an EPUB file to begin conversion")
+        self.window.after(50, self._drain)
+        try:
+            self.window.mainloop()
+        finally:
+            self._close_log_file()
 
 def main():
     """Entry point for the GUI application."""
@@ -4,9 +4,11 @@ This module provides both command-line and GUI interfaces for converting
 EPUB files to PDF format.
 """
 import sys
-import argparse
+from functools import lru_cache
 from pathlib import Path
-from .converter import EpubToPdfConverter, ConversionError
+from . import __version__
+
+VERSION_TEXT = f'EPUB to PDF Converter v{__version__}'
 
 # Check for tkinter availability early
 def check_tkinter_availability():
@@ -35,8 +37,12 @@ def check_tkinter_availability():
         print("\n" + "="*60 + "\n")
         return False
 
+@lru_cache(maxsize=1)
 def create_parser():
-    """Create command line argument parser."""
+    """Create command line argument parser (built once and reused)."""
+    # Imported here so the no-argument and --version paths skip argparse
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Convert EPUB files to PDF format",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -81,13 +87,16 @@ def create_parser():
     parser.add_argument(
         '--version',
         action='version',
-        version='EPUB to PDF Converter v1.0.0'
+        version=VERSION_TEXT
     )
     
     return parser
 
 def cli_convert(input_file: str, output_file: str = None, tolerant: bool = False) -> bool:
     """Perform conversion using command-line interface."""
+    # Imported here so --help/--version and GUI start-up skip the PDF stack
+    from .converter import EpubToPdfConverter, ConversionError
+    
     try:
         # Validate input file
         input_path = Path(input_file)
@@ -99,16 +108,17 @@ def cli_convert(input_file: str, output_file: str = None, tolerant: bool = False
             print(f"Error: Input file must be an EPUB file.")
             return False
             
-        # Set output file
-        if output_file is None:
-            output_file = str(input_path.with_suffix('.pdf'))
-            
-        output_path = Path(output_file)
+        # Set output file; each path is built and stringified once
+        input_str = str(input_path)
+        output_path = Path(output_file) if output_file else input_path.with_suffix('.pdf')
+        output_str = str(output_path)
         
-        # Check if output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create the output directory only when it is missing
+        parent = output_path.parent
+        if not parent.exists():
+            parent.mkdir(parents=True, exist_ok=True)
         
-        print(f"Converting '{input_file}' to '{output_file}'...")
+        print(f"Converting '{input_file}' to '{output_str}'...")
         if tolerant:
             print("Using tolerant mode: will skip malformed HTML elements and continue conversion.")
         
@@ -122,11 +132,11 @@ def cli_convert(input_file: str, output_file: str = None, tolerant: bool = False
         converter.set_progress_callback(progress_callback)
         
         # Perform conversion
-        success = converter.convert(str(input_path), str(output_path))
+        success = converter.convert(input_str, output_str)
         
         if success:
             print(f"Conversion completed successfully!")
-            print(f"Output saved to: {output_file}")
+            print(f"Output saved to: {output_str}")
             return True
         else:
             print("Conversion failed!")
@@ -139,52 +149,45 @@ def cli_convert(input_file: str, output_file: str = None, tolerant: bool = False
         print(f"Unexpected error: {e}")
         return False
 
+def launch_gui(input_file: str = None, output_file: str = None):
+    """Launch the GUI, optionally with input/output files pre-loaded."""
+    if not check_tkinter_availability():
+        sys.exit(1)
+    try:
+        from .gui import EpubToPdfGUI
+        app = EpubToPdfGUI()
+        if input_file:
+            app.epub_path.set(input_file)
+        if output_file:
+            app.pdf_path.set(output_file)
+        app.run()
+    except Exception as e:
+        print(f"Failed to start GUI: {e}")
+        sys.exit(1)
+
 def main():
     """Main entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
-    
-    # If no arguments provided, launch GUI
+    # If no arguments provided, launch GUI (no argument parser needed)
     if len(sys.argv) == 1:
-        if not check_tkinter_availability():
-            sys.exit(1)
-        try:
-            from .gui import EpubToPdfGUI
-            app = EpubToPdfGUI()
-            app.run()
-        except Exception as e:
-            print(f"Failed to start GUI: {e}")
-            sys.exit(1)
+        launch_gui()
+        return
+        
+    # Answer a bare --version without building the parser
+    if sys.argv[1:] == ['--version']:
+        print(VERSION_TEXT)
         return
+        
+    parser = create_parser()
+    args = parser.parse_args()
     
     # If --gui flag is provided, launch GUI
     if args.gui:
-        if not check_tkinter_availability():
-            sys.exit(1)
-        try:
-            from .gui import EpubToPdfGUI
-            app = EpubToPdfGUI()
-            app.run()
-        except Exception as e:
-            print(f"Failed to start GUI: {e}")
-            sys.exit(1)
+        launch_gui()
         return
     
     # If input file is provided but no --cli flag, launch GUI with file pre-loaded
     if args.input_file and not args.cli:
-        if not check_tkinter_availability():
-            sys.exit(1)
-        try:
-            from .gui import EpubToPdfGUI
-            app = EpubToPdfGUI()
-            # Pre-load the file (would need to modify GUI class to accept this)
-            app.epub_path.set(args.input_file)
-            if args.output:
-                app.pdf_path.set(args.output)
-            app.run()
-        except Exception as e:
-            print(f"Failed to start GUI: {e}")
-            sys.exit(1)
+        launch_gui(args.input_file, args.output)
         return
     
     # Command-line mode